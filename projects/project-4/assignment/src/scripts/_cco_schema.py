@@ -0,0 +1,154 @@
+"""Namespaces, IRIs and schema triples shared by the measurement scripts.
+
+Importing this module has no side effects; call setup_graph() to get a graph
+holding the ontology header and schema declarations.
+"""
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDFS
+try:
+    import oxrdflib  # registers the "Oxigraph" store with rdflib
+except ImportError:  # optional: falls back to rdflib's in-memory store
+    oxrdflib = None
+
+NS_EX   = Namespace("http://example.org/measurement/")
+NS_CCO  = Namespace("https://www.commoncoreontologies.org/CommonCoreOntologiesMerged/")
+NS_OWL  = Namespace("http://www.w3.org/2002/07/owl#")
+NS_OBO  = Namespace("http://purl.obolibrary.org/obo/")
+NS_RDF = Namespace("http://www.w3.org/1999/02/22-rdf-syntax-ns#")
+NS_XSD = Namespace("http://www.w3.org/2001/XMLSchema#")
+NS_EXPROP = Namespace("http://example.org/props#")
+NS_EXC = Namespace("http://example.org/classes#")
+
+# Classes
+IRI_SDC   = URIRef("http://purl.obolibrary.org/obo/BFO_0000020")       # State of Disorder/Condition (SDC)
+IRI_ART   = URIRef("https://www.commoncoreontologies.org/ont00000995") # Artifact
+IRI_MICE  = URIRef("https://www.commoncoreontologies.org/ont00001163") # Measurement Information Content Entity (MICE)
+IRI_MU    = URIRef("https://www.commoncoreontologies.org/ont00000120") # Measurement Unit (MU)
+
+# Properties
+IRI_BEARER_OF = URIRef("http://purl.obolibrary.org/obo/BFO_0000196")     # bearer_of (Artifact -> SDC)
+IRI_IS_MEASURE_OF = URIRef("https://www.commoncoreontologies.org/ont00001966") # is_measurement_of (MICE -> SDC)
+IRI_USES_MU       = URIRef("https://www.commoncoreontologies.org/ont00001863") # uses_measurement_unit (MICE -> MU)
+IRI_HAS_VALUE     = URIRef("https://www.commoncoreontologies.org/ont00001769") # has_value (MICE -> Literal Value)
+IRI_HAS_TIMESTAMP = URIRef("https://www.commoncoreontologies.org/ont00001767") # has_timestamp (MICE -> Literal Time)
+
+OBJECT_PROPERTY_DEFS = {
+    NS_OBO.BFO_0000196: "b bearer of c =Def c inheres in b",
+    NS_CCO.ont00001904: "y is_measured_by x iff x is an instance of Information Content Entity and y is an instance of Entity, such that x describes some attribute of y relative to some scale or classification scheme.",
+    NS_CCO.ont00001966: "x is_a_measurement_of y iff x is an instance of Measurement Information Content Entity and y is an instance of Specifically Dependent Continuant (a reading), such that x specifies a value describing some attribute of y relative to some scale or classification scheme.",
+    NS_CCO.ont00001961: "x is_measurement_unit_of y iff x is an instance of Measurement Unit and y is an instance of Measurement Information Content Entity or Specifically Dependent Continuant, such that x describes or qualifies the magnitude of the measured physical quantity referenced in y.",
+}
+CLASS_DEFS = {
+    NS_OBO.BFO_0000020: "A specifically dependent continuant is a continuant & there is some independent continuant c which is not a spatial region and which is such that b s-depends_on c at every time t during the course of b’s existence.",
+    NS_OBO.BFO_0000031: "A generically dependent continuant is a continuant that g-depends_on one or more other entities.",
+    NS_OBO.BFO_0000040: "A material entity is an independent continuant that has some portion of matter as proper or improper continuant part.",
+}
+DIFFERENTIA = {
+    NS_CCO.ont00000995: "is intentionally produced to realize some function or purpose",
+    NS_CCO.ont00001163: "specifies a numeric measurement value together with its associated unit",
+    NS_CCO.ont00000120: "serves to standardize quantities for measurement information content entities and specifically dependent continuants",
+    NS_OBO.BFO_0000197: "relates a specifically dependent continuant to the independent continuant it inheres in",
+    NS_CCO.ont00001966: "links a measurement information content entity to the reading (specifically dependent continuant) that it specifies",
+    NS_CCO.ont00001863: "links a measurement information content entity or a specifically dependent continuant to the unit that qualifies its value",
+    NS_CCO.ont00001769: "associates a measurement information content entity with a numeric value literal",
+}
+DATATYPE_PROPERTY_DEFS = {
+    NS_CCO.ont00001769: "has not yet had its differentiating factor specified",
+    NS_EXPROP.hasTimestamp: "has timestamp",
+}
+
+EXPLICIT_CLASSES = [
+    NS_CCO.ont00000441,
+    NS_CCO.ont00000995,
+    NS_OBO.BFO_0000020,
+    NS_CCO.ont00001163,
+    NS_CCO.ont00000120,
+    NS_OBO.BFO_0000040,
+    NS_OBO.BFO_0000031,
+]
+EXPLICIT_OBJECT_PROPS = [
+    NS_OBO.BFO_0000197,
+    NS_OBO.BFO_0000196,
+    NS_CCO.ont00001966,
+    NS_CCO.ont00001904,
+    NS_CCO.ont00001863,
+    NS_CCO.ont00001961,
+]
+EXPLICIT_DATATYPE_PROPS = [
+    NS_CCO.ont00001769,
+    NS_EXPROP.hasTimestamp,
+]
+
+def setup_graph() -> Graph:
+    """Returns a new graph holding the ontology header, labels and schema declarations.
+
+    The graph is backed by the Oxigraph store when oxrdflib is installed.
+    """
+    if oxrdflib is not None:
+        graph = Graph(store="Oxigraph", bind_namespaces="none")
+    else:
+        graph = Graph()
+    graph.bind("ex", NS_EX)
+    graph.bind("cco", NS_CCO)
+    graph.bind("owl", NS_OWL)
+    graph.bind("obo", NS_OBO)
+    graph.bind("rdf", NS_RDF)
+    graph.bind("rdfs", RDFS)
+    graph.bind("xsd", NS_XSD)
+    graph.bind("exc", NS_EXC)
+    graph.bind("exprop", NS_EXPROP)
+
+    # The schema triples are collected and inserted with one graph.addN() call.
+    triples = []
+    onto_uri = URIRef("http://example.org/ontology")
+    triples.append((onto_uri, NS_RDF.type, NS_OWL.Ontology))
+    triples.append((onto_uri, RDFS.label, Literal("cco conformant measurements", lang="en")))
+
+    triples.append((NS_CCO.ont00000995, RDFS.label, Literal("Artifact", lang="en")))
+    triples.append((NS_OBO.BFO_0000197, RDFS.label, Literal("inheres in", lang="en")))
+    triples.append((NS_CCO.ont00001863, RDFS.label, Literal("uses measurement unit", lang="en")))
+    triples.append((NS_CCO.ont00001606, RDFS.label, Literal("Degree Celsius Measurement Unit", lang="en")))
+    triples.append((NS_CCO.ont00001724, RDFS.label, Literal("Degree Fahrenheit Measurement Unit", lang="en")))
+    triples.append((NS_CCO.ont00000120, RDFS.label, Literal("Measurement Unit", lang="en")))
+    triples.append((NS_CCO.ont00001904, RDFS.label, Literal("is measured by", lang="en")))
+    triples.append((NS_CCO.ont00001163, RDFS.label, Literal("Measurement Information Content Entity", lang="en")))
+    triples.append((NS_CCO.ont00001769, RDFS.label, Literal("has decimal value", lang="en")))
+    triples.append((NS_CCO.BFO_0000196, RDFS.label, Literal("bearer of", lang="en")))
+    triples.append((NS_CCO.ont00001961, RDFS.label, Literal("is measurement unit of", lang="en")))
+    triples.append((NS_CCO.ont00001966, RDFS.label, Literal("is a measurement of", lang="en")))
+    triples.append((NS_CCO.ont00001450, RDFS.label, Literal("Volt Measurement Unit", lang="en")))
+    triples.append((NS_CCO.ont00001559, RDFS.label, Literal("Pascal Measurement Unit", lang="en")))
+    triples.append((NS_CCO.ont00001694, RDFS.label, Literal("Pounds Per Square Inch Measurement Unit", lang="en")))
+    triples.append((NS_EXPROP.hasTimestamp, RDFS.label, Literal("has timestamp", lang="en")))
+
+    for k in EXPLICIT_CLASSES:
+        triples.append((k, NS_RDF.type, NS_OWL.Class))
+    for p in EXPLICIT_OBJECT_PROPS:
+        triples.append((p, NS_RDF.type, NS_OWL.ObjectProperty))
+    for p in EXPLICIT_DATATYPE_PROPS:
+        triples.append((p, NS_RDF.type, NS_OWL.DatatypeProperty))
+
+    # The graph is new, so every term in the definition tables still needs its definition.
+    for klass, desc in CLASS_DEFS.items():
+        triples.append((klass, NS_RDF.type, NS_OWL.Class))
+        triples.append((klass, RDFS.comment, Literal(desc.strip(), lang="en")))
+    for prop, desc in OBJECT_PROPERTY_DEFS.items():
+        triples.append((prop, NS_RDF.type, NS_OWL.ObjectProperty))
+        triples.append((prop, RDFS.comment, Literal(desc.strip(), lang="en")))
+    for prop, desc in DATATYPE_PROPERTY_DEFS.items():
+        triples.append((prop, NS_RDF.type, NS_OWL.DatatypeProperty))
+        triples.append((prop, RDFS.comment, Literal(desc.strip(), lang="en")))
+
+    triples.append((NS_OBO.BFO_0000196, NS_OWL.inverseOf, NS_OBO.BFO_0000197))
+    triples.append((NS_OBO.BFO_0000197, NS_OWL.inverseOf, NS_OBO.BFO_0000196))
+    triples.append((NS_CCO.ont00001904, NS_OWL.inverseOf, NS_CCO.ont00001966))
+    triples.append((NS_CCO.ont00001966, NS_OWL.inverseOf, NS_CCO.ont00001904))
+    triples.append((NS_CCO.ont00001961, NS_OWL.inverseOf, NS_CCO.ont00001863))
+    triples.append((NS_CCO.ont00001863, NS_OWL.inverseOf, NS_CCO.ont00001961))
+
+    triples.append((NS_CCO.ont00000441, RDFS.subClassOf, NS_OBO.BFO_0000020))
+    triples.append((NS_CCO.ont00000995, RDFS.subClassOf, NS_OBO.BFO_0000040))
+    triples.append((NS_CCO.ont00001163, RDFS.subClassOf, NS_OBO.BFO_0000031))
+    triples.append((NS_CCO.ont00000120, RDFS.subClassOf, NS_OBO.BFO_0000031))
+    graph.addN((s, p, o, graph) for s, p, o in triples)
+    return graph
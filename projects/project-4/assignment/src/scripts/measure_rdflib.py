@@ -0,0 +1,959 @@
+from rdflib import Graph, Literal, RDFS, XSD, URIRef
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import gzip
+import itertools
+import multiprocessing
+import os
+import re
+import sys
+import weakref
+from decimal import Decimal, InvalidOperation
+try:
+    import pyoxigraph
+except ImportError:  # optional: falls back to rdflib's Turtle serializer
+    pyoxigraph = None
+try:
+    import oxrdflib  # provides the OxigraphStore that setup_graph() may use
+except ImportError:  # optional: falls back to rdflib's in-memory store
+    oxrdflib = None
+try:
+    from pyjelly.integrations.generic.generic_sink import IRI as JellyIRI, Literal as JellyLiteral, Triple as JellyTriple
+    from pyjelly.integrations.generic.serialize import flat_stream_to_file
+except ImportError:  # optional: only needed for .jelly output
+    flat_stream_to_file = None
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: falls back to pandas' CSV reader
+    pa = pacsv = None
+from _cco_schema import (
+    NS_EX, NS_CCO, NS_OWL, NS_OBO, NS_RDF, NS_XSD, NS_EXPROP, NS_EXC,
+    IRI_SDC, IRI_ART, IRI_MICE, IRI_MU,
+    IRI_BEARER_OF, IRI_IS_MEASURE_OF, IRI_USES_MU, IRI_HAS_VALUE, IRI_HAS_TIMESTAMP,
+    DIFFERENTIA, setup_graph,
+)
+
+script_dir = Path(__file__).parent
+root_dir = script_dir.parent
+
+CSV_FILE = root_dir / 'data' / 'readings_normalized.csv'
+# Set MEASURE_CCO_OUT to e.g. measure_cco.nt.gz to write gzip-compressed N-Triples instead.
+OUT_FILE = Path(os.environ.get('MEASURE_CCO_OUT', root_dir / 'measure_cco.ttl'))
+CHUNK_SIZE = 50_000
+WORKERS = os.cpu_count() or 1
+
+# Namespace bases as plain str, so building a URI is a single str concatenation
+# rather than a Namespace operation.
+EX_BASE = str(NS_EX)
+EXC_BASE = str(NS_EXC)
+
+# The caches below are kept per graph and hold their graph weakly, so a second graph
+# built in the same process starts from empty caches.
+# Terms known to carry an English rdfs:comment, whether added here or found in the graph.
+_defined_terms = weakref.WeakKeyDictionary()
+# Labels and parents are looked up repeatedly by the enrichment pass, which only
+# adds comments, so each is resolved from the graph once. add_missing_definitions()
+# clears both before it starts, since add_quality_classes() may have added labels.
+_label_cache = weakref.WeakKeyDictionary()
+_parent_cache = weakref.WeakKeyDictionary()
+
+def article_for(s: str) -> str:
+    return "An" if s[:1].lower() in ("a", "e", "i", "o", "u") else "A"
+
+def label_or_localname(graph: Graph, iri: URIRef) -> str:
+    labels = _label_cache.setdefault(graph, {})
+    label = labels.get(iri)
+    if label is None:
+        label = labels[iri] = _find_label(graph, iri)
+    return label
+
+def _find_label(graph: Graph, iri: URIRef) -> str:
+    for _, _, lab in graph.triples((iri, RDFS.label, None)):
+        if isinstance(lab, Literal) and (lab.language or "").lower().startswith("en") and str(lab).strip():
+            return str(lab).strip()
+    s = str(iri)
+    local = s.rsplit("#", 1)[-1] if "#" in s else s.rsplit("/", 1)[-1]
+    return local.replace("_", " ").replace("-", " ").strip()
+
+def parent_of(graph: Graph, term: URIRef):
+    parents = _parent_cache.setdefault(graph, {})
+    if term not in parents:
+        parents[term] = next(
+            (parent for _, _, parent in graph.triples((term, RDFS.subClassOf, None)) if isinstance(parent, URIRef)),
+            None,
+        )
+    return parents[term]
+
+def ensure_definition(graph: Graph, term_iri: URIRef, definition_text: str):
+    if not definition_text or not str(definition_text).strip():
+        definition_text = "Definition not provided."
+    if not has_english_definition(graph, term_iri):
+        graph.add((term_iri, RDFS.comment, Literal(definition_text.strip(), lang="en")))
+        _defined_terms.setdefault(graph, set()).add(term_iri)
+
+def has_english_definition(graph: Graph, term_iri: URIRef) -> bool:
+    defined_terms = _defined_terms.setdefault(graph, set())
+    if term_iri in defined_terms:
+        return True
+    for _, _, c in graph.triples((term_iri, RDFS.comment, None)):
+        if isinstance(c, Literal) and c.language and c.language.lower().startswith("en") and str(c).strip():
+            defined_terms.add(term_iri)
+            return True
+    return False
+
+def make_non_self_referential(graph: Graph, def_text: str, class_iri: URIRef) -> str:
+    if not isinstance(def_text, str) or not def_text.strip():
+        return def_text
+    class_label = label_or_localname(graph, class_iri).strip()
+    iri_str = str(class_iri)
+    local_token = iri_str.rsplit("#", 1)[-1] if "#" in iri_str else iri_str.rsplit("/", 1)[-1]
+    local_token = local_token.strip()
+    lower_def = def_text.lower()
+    split_needles = (" is a ", " is an ")
+    split_idx = -1
+    needle_used = None
+    for needle in split_needles:
+        i = lower_def.find(needle)
+        if i != -1:
+            split_idx = i
+            needle_used = def_text[i:i+len(needle)]
+            break
+    if split_idx == -1:
+        return def_text
+
+    head = def_text[:split_idx + len(needle_used)]
+    body = def_text[split_idx + len(needle_used):]
+    return head + _self_reference_rewriter(class_label, local_token)(body)
+
+# One compiled pattern per (label, local name) pair; the enrichment pass only sees
+# a handful of classes.
+_rewriter_cache = {}
+
+def _self_reference_rewriter(class_label: str, local_token: str):
+    """Returns a function that replaces whole-word mentions of a class in one pass.
+
+    The label becomes "this quality" and a differing local name "this class".
+    """
+    key = (class_label.lower(), local_token.lower())
+    rewriter = _rewriter_cache.get(key)
+    if rewriter is None:
+        replacements = {}
+        if class_label:
+            replacements[key[0]] = "this quality"
+        if local_token:
+            replacements.setdefault(key[1], "this class")
+        if not replacements:
+            rewriter = _rewriter_cache[key] = lambda text: text
+            return rewriter
+        alternation = "|".join(re.escape(token) for token in sorted(replacements, key=len, reverse=True))
+        pattern = re.compile(r'(?i)(?<![A-Za-z0-9_])(?:' + alternation + r')(?![A-Za-z0-9_])')
+        rewriter = _rewriter_cache[key] = lambda text: pattern.sub(
+            lambda match: replacements[match.group(0).lower()], text
+        )
+    return rewriter
+
+def ensure_clean_definition(graph: Graph, term_iri: URIRef, definition_text: str, declared_classes: set):
+    """Adds definition_text, rewritten to avoid naming the term itself when it is a class.
+
+    declared_classes holds the graph's owl:Class and rdfs:Class subjects.
+    """
+    is_class = term_iri in declared_classes
+    clean_text = make_non_self_referential(graph, definition_text, term_iri) if is_class else definition_text
+    ensure_definition(graph, term_iri, clean_text)
+
+_SLUG_ALLOWED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_")
+
+class _SlugTable(dict):
+    """str.translate() table mapping every character outside _SLUG_ALLOWED to "-".
+
+    Entries are filled in on first sight of each code point, so any Unicode input works.
+    """
+    def __missing__(self, codepoint):
+        self[codepoint] = codepoint if chr(codepoint) in _SLUG_ALLOWED else "-"
+        return self[codepoint]
+
+_SLUG_TABLE = _SlugTable()
+# Kind tokens are compared on their lowercase alphanumeric runs.
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+def _slug(text: str) -> str:
+    # One C-level translate pass, then split/join drops edge dashes and collapses runs.
+    t = (text or "").translate(_SLUG_TABLE)
+    return "-".join(filter(None, t.split("-"))) or "na"
+
+KIND_ALIASES = {
+    "Temperature": {"temperature", "temp", "tmp", "t", "degc", "degf", "c", "f"},
+    "Pressure": {"pressure", "press", "psi", "bar", "pa", "kpa"},
+    "Humidity": {"humidity", "rh", "rel humidity", "relative humidity"},
+    "Resistance": {"resistance", "res", "ohm", "ohms", "ω", "r"},
+    "Voltage": {"voltage", "volt", "volts", "v"},
+}
+QUALITIES_FOR_CLASSING = {"Pressure", "Temperature", "Resistance", "Voltage"}
+# Inverted once at import: alias -> (canonical label, canonical slug).
+_KIND_BY_ALIAS = {
+    alias: (canonical, _slug(canonical.lower()))
+    for canonical, forms in KIND_ALIASES.items()
+    for alias in forms
+}
+
+def canonicalize_kind(raw: str) -> tuple[str, str]:
+    base = (raw or "").strip().lower()
+    base = _NON_ALNUM.sub(" ", base).strip()
+    kind = _KIND_BY_ALIAS.get(base)
+    if kind is not None:
+        return kind
+    canon = base.title() if base else "Unknown"
+    return canon, _slug(canon.lower())
+
+UNIT_ALIASES = {
+    "c": {"c", "degc", "celsius", "°c"},
+    "f": {"f", "degf", "fahrenheit", "°f"},
+    "pa": {"pa", "pascal"},
+    "kpa": {"kpa", "kilopascal", "kilopascals"},
+    "psi": {"psi"},
+    "volt": {"v", "volt", "volts"},
+    "ohm": {"ohm", "ohms", "ω", "omega"},
+}
+
+# Inverted once at import: alias -> canonical token, first for the aliases as
+# written, then for their alphanumeric-only forms. An alias listed under two
+# tokens keeps the first, as the original in-order scan did.
+_UNIT_BY_ALIAS = {}
+_UNIT_BY_STRIPPED_ALIAS = {}
+for _canon, _forms in UNIT_ALIASES.items():
+    for _alias in _forms:
+        _UNIT_BY_ALIAS.setdefault(_alias, _canon)
+        _UNIT_BY_STRIPPED_ALIAS.setdefault(_NON_ALNUM.sub("", _alias), _canon)
+
+def _normalize_unit_token(u_raw: str) -> str:
+    base = (u_raw or "").strip().lower()
+    if base and base in _UNIT_BY_ALIAS:
+        return _UNIT_BY_ALIAS[base]
+    base2 = _NON_ALNUM.sub("", base)
+    return _UNIT_BY_STRIPPED_ALIAS.get(base2, base2 or "na")
+
+# Canonical unit token -> (unit URI string, factor to the unit's base scale, is a CCO unit).
+# Factors are Decimals, so a scaled value stays exact.
+UNIT_DISPATCH = {
+    "c": (str(NS_CCO.ont00001606), 1, True),
+    "f": (str(NS_CCO.ont00001724), 1, True),
+    "kpa": (str(NS_CCO.ont00001559), Decimal(1000), True),
+    "pa": (str(NS_CCO.ont00001559), 1, True),
+    "psi": (str(NS_CCO.ont00001694), 1, True),
+    "volt": (str(NS_CCO.ont00001450), 1, True),
+    "ohm": (EX_BASE + "ohm", 1, False),
+}
+# Raw unit label -> its UNIT_DISPATCH entry; units repeat on nearly every row.
+resolved_unit_cache = {}
+
+def resolve_unit(unit_raw: str):
+    """Returns (unit URI string, scale factor, is a CCO unit) for a raw unit label; depends on the label only."""
+    resolved = resolved_unit_cache.get(unit_raw)
+    if resolved is None:
+        resolved = resolved_unit_cache[unit_raw] = (
+            UNIT_DISPATCH.get(_normalize_unit_token(unit_raw)) or (EX_BASE + _slug(unit_raw), 1, False)
+        )
+    return resolved
+
+# Canonical kind label -> its quality class, or None for kinds that are not classed.
+quality_class_cache = {}
+_UNRESOLVED = object()
+
+def quality_class(canon_kind_label, canon_kind_slug):
+    """Returns the quality class for a canonical kind, or None if the kind is not classed."""
+    qual_class_uri = quality_class_cache.get(canon_kind_label, _UNRESOLVED)
+    if qual_class_uri is _UNRESOLVED:
+        if canon_kind_label not in QUALITIES_FOR_CLASSING:
+            qual_class_uri = None
+        elif canon_kind_label == "Temperature":
+            qual_class_uri = NS_CCO.ont00000441
+        else:
+            qual_class_uri = URIRef(EXC_BASE + canon_kind_slug)
+        quality_class_cache[canon_kind_label] = qual_class_uri
+    return qual_class_uri
+
+# Classes the streamed instance triples are typed with; add_missing_definitions()
+# needs them, but the instances themselves are never added to the graph.
+STREAMED_CLASSES = {
+    IRI_ART, IRI_SDC, IRI_MU, IRI_MICE,
+    NS_CCO.ont00000995, NS_CCO.ont00000120, NS_CCO.ont00001163,
+}
+
+def add_quality_class(graph, canon_kind_label, canon_kind_slug):
+    """Declares the quality class for a canonical kind and returns it, or None if the kind is not classed."""
+    qual_class_uri = quality_class(canon_kind_label, canon_kind_slug)
+    if qual_class_uri is None:
+        return None
+    if canon_kind_label == "Temperature":
+        graph.addN([
+            (qual_class_uri, NS_RDF.type, NS_OWL.Class, graph),
+            (qual_class_uri, RDFS.label, Literal("Temperature", lang="en"), graph),
+        ])
+        return qual_class_uri
+    graph.addN([
+        (qual_class_uri, NS_RDF.type, NS_OWL.Class, graph),
+        (qual_class_uri, RDFS.subClassOf, NS_OBO.BFO_0000020, graph),
+        (qual_class_uri, RDFS.label, Literal(canon_kind_label, lang="en"), graph),
+    ])
+    _qdef = (
+        f"{article_for(canon_kind_label)} {canon_kind_label} is a Specifically Dependent Continuant quality "
+        f"that can inhere in a material entity and is typically subject to measurement."
+    )
+    ensure_definition(graph, qual_class_uri, _qdef)
+    return qual_class_uri
+
+def add_quality_classes(graph, kinds):
+    """Declares the quality class of each distinct sdc_kind in kinds.
+
+    Only the class declarations enter the graph, never a triple per reading.
+    Returns the set of quality classes declared.
+    """
+    quality_classes = set()
+    canonical_kinds = {canonicalize_kind(kind) for kind in pd.unique(kinds.str.strip()) if kind}
+    for canon_kind_label, canon_kind_slug in canonical_kinds:
+        qual_class_uri = add_quality_class(graph, canon_kind_label, canon_kind_slug)
+        if qual_class_uri is not None:
+            quality_classes.add(qual_class_uri)
+    return quality_classes
+
+def add_missing_definitions(graph, typed_classes):
+    """Gives every class and property in graph that lacks an English definition a generated one.
+
+    typed_classes holds every class used as an rdf:type object, as tracked while
+    the graph was built, so the instance type triples never have to be scanned.
+    """
+    _label_cache.pop(graph, None)
+    _parent_cache.pop(graph, None)
+    defined_terms = _defined_terms.setdefault(graph, set())
+    # Only schema terms carry comments, so one pass over them finds every term that
+    # is already defined; the loops below then only visit the rest.
+    for term, _, c in graph.triples((None, RDFS.comment, None)):
+        if isinstance(c, Literal) and c.language and c.language.lower().startswith("en") and str(c).strip():
+            defined_terms.add(term)
+    # Class declarations are read once up front; the loop below only adds comments.
+    owl_classes = set(graph.subjects(NS_RDF.type, NS_OWL.Class))
+    declared_classes = owl_classes | set(graph.subjects(NS_RDF.type, RDFS.Class))
+    seen_classes = set()
+    for c in owl_classes:
+        if isinstance(c, URIRef):
+            seen_classes.add(c)
+    for class_iri in typed_classes:
+        if isinstance(class_iri, URIRef):
+            seen_classes.add(class_iri)
+    for c in seen_classes - defined_terms:
+        label = label_or_localname(graph, c)
+        parent = parent_of(graph, c)
+        parent_label = label_or_localname(graph, parent) if parent else "parent class (unspecified)"
+        definition_tail = DIFFERENTIA.get(
+            c,
+            f"has not yet had its differentiating factor specified relative to {parent_label}"
+        )
+        definition = f"{article_for(label)} {label} is a {parent_label} that {definition_tail}."
+        ensure_clean_definition(graph, c, definition, declared_classes)
+
+    seen_object_properties = set()
+    for p in graph.subjects(NS_RDF.type, NS_OWL.ObjectProperty):
+        if isinstance(p, URIRef):
+            seen_object_properties.add(p)
+    for p in seen_object_properties - defined_terms:
+        a = label_or_localname(graph, p)
+        cmt = f"{article_for(a)} {a} is an object property that {DIFFERENTIA.get(p, 'has not yet had its differentiating factor specified')} ."
+        ensure_definition(graph, p, cmt)
+
+    seen_datatype_properties = set()
+    for p in graph.subjects(NS_RDF.type, NS_OWL.DatatypeProperty):
+        if isinstance(p, URIRef):
+            seen_datatype_properties.add(p)
+    for p in seen_datatype_properties - defined_terms:
+        a = label_or_localname(graph, p)
+        cmt = f"{article_for(a)} {a} is a datatype property that {DIFFERENTIA.get(p, 'has not yet had its differentiating factor specified')} ."
+        ensure_definition(graph, p, cmt)
+
+TURTLE_PREFIXES = {
+    "ex": NS_EX, "cco": NS_CCO, "owl": NS_OWL, "obo": NS_OBO, "rdf": NS_RDF,
+    "rdfs": RDFS, "xsd": NS_XSD, "exc": NS_EXC, "exprop": NS_EXPROP,
+}
+
+def serialize_turtle(graph):
+    """Returns graph as Turtle, using pyoxigraph's Rust writer when it is installed."""
+    if oxrdflib is not None and isinstance(graph.store, oxrdflib.OxigraphStore):
+        return graph.serialize(format='ox-turtle')
+    if pyoxigraph is None:
+        return graph.serialize(format='turtle')
+    triples = pyoxigraph.parse(graph.serialize(format='nt'), format=pyoxigraph.RdfFormat.N_TRIPLES)
+    prefixes = {prefix: str(ns) for prefix, ns in TURTLE_PREFIXES.items()}
+    return pyoxigraph.serialize(triples, format=pyoxigraph.RdfFormat.TURTLE, prefixes=prefixes).decode('utf-8')
+
+# Streamed instance URIs are plain strings under EX_BASE. They are only ever written
+# inside <...> in N-Triples, so no URIRef (and no Namespace validity check) is needed.
+
+# Artifact, SDC and MU URIs only depend on a few low-cardinality columns,
+# so each one is built once and reused for every later row.
+artifact_cache = {}
+sdc_cache = {}
+mu_cache = {}
+# Spaces become underscores and hyphens are dropped in a single translate pass, which
+# also percent-encodes the characters an IRI may not hold, so the <...> stays valid.
+# "%" itself is encoded too, so a raw "%" is never read as the start of an escape
+# and e.g. "a<b" and "a%3Cb" stay distinct.
+_IRI_UNSAFE = '%<>"{}|^`\\' + "".join(map(chr, range(0x20)))
+_SAFE_TBL = str.maketrans({" ": "_", "-": None, **{c: f"%{ord(c):02X}" for c in _IRI_UNSAFE}})
+# The raw ids, kinds and units repeat on nearly every row, so each safe name is
+# translated once and the same string object is handed back afterwards.
+safe_name_cache = {}
+
+def safe_name(raw):
+    """Returns raw made safe for use in a URI local name, cached per raw value."""
+    safe = safe_name_cache.get(raw)
+    if safe is None:
+        safe = safe_name_cache[raw] = sys.intern(raw.translate(_SAFE_TBL))
+    return safe
+
+def bearer_uris(artifact_id, sdc_kind):
+    """Returns the cached Artifact and SDC URI strings for an artifact's SDC kind."""
+    artifact_uri = artifact_cache.get(artifact_id)
+    if artifact_uri is None:
+        artifact_uri = artifact_cache[artifact_id] = f"{EX_BASE}Artifact_{safe_name(artifact_id)}"
+    sdc_uri = sdc_cache.get((artifact_id, sdc_kind))
+    if sdc_uri is None:
+        sdc_uri = sdc_cache[(artifact_id, sdc_kind)] = f"{EX_BASE}SDC_{safe_name(artifact_id)}_{safe_name(sdc_kind)}"
+    return artifact_uri, sdc_uri
+
+def unit_uri(unit_label):
+    """Returns the cached MU URI string for a unit label."""
+    mu_uri = mu_cache.get(unit_label)
+    if mu_uri is None:
+        mu_uri = mu_cache[unit_label] = f"{EX_BASE}MU_{safe_name(unit_label)}"
+    return mu_uri
+
+def static_uris(artifact_id, sdc_kind, unit_label):
+    """Returns the cached Artifact, SDC and MU URI strings for a reading."""
+    return (*bearer_uris(artifact_id, sdc_kind), unit_uri(unit_label))
+
+# MV and MICE ids are 64-bit pandas hashes, computed a whole column at a time.
+# They only need to be unique and stable across runs, not cryptographic.
+READING_COLUMNS = ['artifact_id', 'sdc_kind', 'unit_label', 'value', 'timestamp']
+
+def value_ids(values):
+    """Returns the MV id of each reading value, as a uint64 array."""
+    return pd.util.hash_array(values)
+
+def reading_ids(df):
+    """Returns the MICE id of each reading in df, hashed over all five reading fields."""
+    return pd.util.hash_pandas_object(df[READING_COLUMNS], index=False).to_numpy()
+
+# Literal datatypes as plain str; an XSD attribute lookup costs about a microsecond.
+XSD_DECIMAL = str(XSD.decimal)
+XSD_DATETIME = str(XSD.dateTime)
+# N-Triples renderings of the fixed classes and predicates, built once.
+P_TYPE = f"<{NS_RDF.type}>"
+P_BEARER_OF = f"<{IRI_BEARER_OF}>"
+P_IS_MEASURE_OF = f"<{IRI_IS_MEASURE_OF}>"
+P_USES_MU = f"<{IRI_USES_MU}>"
+P_HAS_VALUE = f"<{IRI_HAS_VALUE}>"
+P_HAS_TIMESTAMP = f"<{IRI_HAS_TIMESTAMP}>"
+T_ART = f"<{IRI_ART}>"
+T_SDC = f"<{IRI_SDC}>"
+T_MU = f"<{IRI_MU}>"
+T_MICE = f"<{IRI_MICE}>"
+# The per-reading triples state each reading as an SDC of its quality class that
+# inheres in its artifact and is measured by a MICE holding the unit-scaled value,
+# under the CCO merged namespace that setup_graph() declares.
+P_LABEL = f"<{RDFS.label}>"
+P_INHERES_IN = f"<{NS_OBO.BFO_0000197}>"
+P_IS_MEASURED_BY = f"<{NS_CCO.ont00001904}>"
+P_CCO_IS_MEASURE_OF = f"<{NS_CCO.ont00001966}>"
+P_CCO_USES_MU = f"<{NS_CCO.ont00001863}>"
+P_CCO_HAS_VALUE = f"<{NS_CCO.ont00001769}>"
+P_EX_HAS_TIMESTAMP = f"<{NS_EXPROP.hasTimestamp}>"
+T_CCO_ART = f"<{NS_CCO.ont00000995}>"
+T_CCO_MU = f"<{NS_CCO.ont00000120}>"
+T_CCO_MICE = f"<{NS_CCO.ont00001163}>"
+
+# Turtle output declares these prefixes ahead of the instance blocks and writes the
+# fixed predicates and classes as prefixed names, which keeps every MICE block
+# about half as long. Instance URIs stay in <...>, as safe_name() does not
+# guarantee a valid Turtle local name. "cco" comes before "ont", whose namespace
+# is a prefix of the merged one.
+INSTANCE_PREFIXES = {
+    "obo": str(NS_OBO), "cco": str(NS_CCO), "ont": "https://www.commoncoreontologies.org/",
+    "rdfs": str(RDFS), "exprop": str(NS_EXPROP),
+}
+TURTLE_PREFIX_LINES = "".join(f"@prefix {prefix}: <{ns}> .\n" for prefix, ns in INSTANCE_PREFIXES.items())
+
+def turtle_term(term):
+    """Returns an N-Triples IRI term as a Turtle prefixed name under INSTANCE_PREFIXES."""
+    for prefix, ns in INSTANCE_PREFIXES.items():
+        if term.startswith(f"<{ns}"):
+            return f"{prefix}:{term[len(ns) + 1:-1]}"
+    return term
+
+TURTLE_TERMS = {
+    term: turtle_term(term)
+    for term in (
+        P_BEARER_OF, P_IS_MEASURE_OF, P_USES_MU, P_HAS_VALUE, P_HAS_TIMESTAMP, T_ART, T_SDC, T_MU, T_MICE,
+        P_LABEL, P_INHERES_IN, P_IS_MEASURED_BY, P_CCO_IS_MEASURE_OF, P_CCO_USES_MU, P_CCO_HAS_VALUE,
+        P_EX_HAS_TIMESTAMP, T_CCO_ART, T_CCO_MU, T_CCO_MICE,
+    )
+}
+TURTLE_TERMS[P_TYPE] = "a"
+
+# Characters a quoted N-Triples (and Turtle) string may not hold unescaped.
+_NT_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+def nt_literal(lexical, datatype):
+    """Formats an N-Triples typed literal, escaping the characters N-Triples reserves."""
+    lexical = str(lexical).translate(_NT_ESCAPES)
+    return f'"{lexical}"^^<{datatype}>'
+
+def nt_label(text):
+    """Formats an N-Triples English-language literal, escaping like nt_literal()."""
+    return f'"{str(text).translate(_NT_ESCAPES)}"@en'
+
+def nt_literals(column, datatype):
+    """Formats a whole column of lexical forms as N-Triples typed literals, like nt_literal().
+
+    Multi-channel readings share timestamps, so each distinct lexical form is
+    formatted once and broadcast back to the rows by factorized code.
+    """
+    codes, uniques = pd.factorize(column)
+    uniques = pd.Series(uniques, dtype=object)
+    escaped = uniques.str.translate(_NT_ESCAPES)
+    return ('"' + escaped + f'"^^<{datatype}>').to_numpy()[codes]
+
+def generate_static_triples(sdcs, units, values, seen_static_entities):
+    """Yields (subject, predicate, object) N-Triples terms for the Artifact, SDC, MU and MV
+    entities whose URI is not yet in seen_static_entities.
+
+    sdcs holds the distinct (artifact_id, sdc_kind) rows of a chunk, and units and
+    values its distinct unit labels and reading values, so each loop runs once per
+    entity rather than once per reading. The seen set only dedups across chunks.
+    """
+    for artifact_id, sdc_kind in zip(sdcs['artifact_id'].to_numpy(), sdcs['sdc_kind'].to_numpy()):
+        artifact_uri, sdc_uri = bearer_uris(artifact_id, sdc_kind)
+        if artifact_uri not in seen_static_entities:
+            yield (f"<{artifact_uri}>", P_TYPE, T_ART)
+            seen_static_entities.add(artifact_uri)
+        if sdc_uri not in seen_static_entities:
+            yield (f"<{artifact_uri}>", P_BEARER_OF, f"<{sdc_uri}>")
+            yield (f"<{sdc_uri}>", P_TYPE, T_SDC)
+            seen_static_entities.add(sdc_uri)
+    for unit_label in units:
+        mu_uri = unit_uri(unit_label)
+        if mu_uri not in seen_static_entities:
+            yield (f"<{mu_uri}>", P_TYPE, T_MU)
+            seen_static_entities.add(mu_uri)
+    for value, mv_id in zip(values, value_ids(values)):
+        mv_uri = f"{EX_BASE}MV_{mv_id:016x}"
+        if mv_uri not in seen_static_entities:
+            yield (f"<{mv_uri}>", P_HAS_VALUE, nt_literal(value, XSD_DECIMAL))
+            seen_static_entities.add(mv_uri)
+
+def generate_all_uris(df):
+    """Returns the SDC, MU and MV URI strings of every reading in df, as arrays, and
+    its MICE ids as a list of ints.
+
+    Static URIs are resolved once per distinct (artifact_id, sdc_kind, unit_label)
+    row and broadcast back to the readings by factorized code.
+    """
+    codes, combos = pd.MultiIndex.from_frame(df[['artifact_id', 'sdc_kind', 'unit_label']]).factorize()
+    static = [static_uris(*combo) for combo in combos]
+    sdc_uris = np.array([sdc_uri for _, sdc_uri, _ in static], dtype=object)[codes]
+    mu_uris = np.array([mu_uri for _, _, mu_uri in static], dtype=object)[codes]
+    # Readings repeat a small set of values, so MV URIs are likewise built per distinct value.
+    value_codes, values = pd.factorize(df['value'].to_numpy())
+    mv_uris = np.array([f"{EX_BASE}MV_{mv_id:016x}" for mv_id in value_ids(values)], dtype=object)[value_codes]
+    return sdc_uris, mu_uris, mv_uris, reading_ids(df).tolist()
+
+def generate_triples(df):
+    """Yields (MICE id, text) for each reading in df, the text holding its five MICE
+    triples, one N-Triples line each."""
+    for sdc_uri, mu_uri, mv_uri, mice_id, timestamp in zip(
+        *generate_all_uris(df), nt_literals(df['timestamp'], XSD_DATETIME),
+    ):
+        mice_nt = f"<{EX_BASE}MICE_{mice_id:016x}>"
+        yield mice_id, (
+            f"{mice_nt} {P_TYPE} {T_MICE} .\n"
+            f"{mice_nt} {P_IS_MEASURE_OF} <{sdc_uri}> .\n"
+            f"{mice_nt} {P_USES_MU} <{mu_uri}> .\n"
+            f"{mice_nt} {P_HAS_VALUE} <{mv_uri}> .\n"
+            f"{mice_nt} {P_HAS_TIMESTAMP} {timestamp} .\n"
+        )
+
+def generate_turtle(df):
+    """Yields (MICE id, Turtle block) for each reading in df, the block holding its
+    five MICE triples.
+
+    The MICE is written once as the subject of a predicate-object list rather than
+    repeated on five N-Triples lines.
+    """
+    TTL_MICE, TTL_IS_MEASURE_OF, TTL_USES_MU, TTL_HAS_VALUE, TTL_HAS_TIMESTAMP = (
+        TURTLE_TERMS[term] for term in (T_MICE, P_IS_MEASURE_OF, P_USES_MU, P_HAS_VALUE, P_HAS_TIMESTAMP)
+    )
+    for sdc_uri, mu_uri, mv_uri, mice_id, timestamp in zip(
+        *generate_all_uris(df), nt_literals(df['timestamp'], XSD_DATETIME),
+    ):
+        yield mice_id, (
+            f"<{EX_BASE}MICE_{mice_id:016x}> a {TTL_MICE} ;\n"
+            f"    {TTL_IS_MEASURE_OF} <{sdc_uri}> ;\n"
+            f"    {TTL_USES_MU} <{mu_uri}> ;\n"
+            f"    {TTL_HAS_VALUE} <{mv_uri}> ;\n"
+            f"    {TTL_HAS_TIMESTAMP} {timestamp} .\n"
+        )
+
+def generate_terms(df):
+    """Yields (MICE id, triples) for each reading in df, its five MICE triples as
+    (subject, predicate, object) N-Triples term tuples."""
+    for sdc_uri, mu_uri, mv_uri, mice_id, timestamp in zip(
+        *generate_all_uris(df), nt_literals(df['timestamp'], XSD_DATETIME),
+    ):
+        mice_nt = f"<{EX_BASE}MICE_{mice_id:016x}>"
+        yield mice_id, [
+            (mice_nt, P_TYPE, T_MICE),
+            (mice_nt, P_IS_MEASURE_OF, f"<{sdc_uri}>"),
+            (mice_nt, P_USES_MU, f"<{mu_uri}>"),
+            (mice_nt, P_HAS_VALUE, f"<{mv_uri}>"),
+            (mice_nt, P_HAS_TIMESTAMP, timestamp),
+        ]
+
+# Jelly output keeps the term tuples themselves; N-Triples output needs one triple
+# per line; everything else gets Turtle blocks.
+JELLY_OUT = OUT_FILE.suffix == '.jelly'
+TURTLE_OUT = '.nt' not in OUT_FILE.suffixes and not JELLY_OUT
+
+def render_triples(triples):
+    """Formats (subject, predicate, object) N-Triples terms as output text.
+
+    For Turtle output each subject's triples are gathered into one
+    predicate-object list, so e.g. an Artifact and all of its bearer_of links
+    share a block. For Jelly output the tuples are returned as a list.
+    """
+    if JELLY_OUT:
+        return list(triples)
+    if not TURTLE_OUT:
+        return "".join(f"{s} {p} {o} .\n" for s, p, o in triples)
+    by_subject = {}
+    for s, p, o in triples:
+        by_subject.setdefault(s, []).append(f"{TURTLE_TERMS.get(p, p)} {TURTLE_TERMS.get(o, o)}")
+    return "".join(f"{s} " + " ;\n    ".join(pos) + " .\n" for s, pos in by_subject.items())
+
+# Lexical form of xsd:decimal. Values that match are written exactly as they appear
+# in the CSV, so there is no float round trip and no loss of precision.
+XSD_DECIMAL_PATTERN = r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)'
+
+def _decimal_from_exponent(text):
+    """Returns a value in exponent notation (e.g. 1e-05) as an xsd:decimal lexical form.
+
+    Text that is not a finite number is returned unchanged.
+    """
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        return text
+    return format(value, 'f') if value.is_finite() else text
+
+def decimal_lexical(values):
+    """Rewrites a column of value strings as xsd:decimal lexical forms where needed.
+
+    Values already in decimal form are kept as written; xsd:decimal has no
+    exponent, so e.g. 1e-05 becomes 0.00001.
+    """
+    is_decimal = values.str.fullmatch(XSD_DECIMAL_PATTERN)
+    if is_decimal.all():
+        return values
+    return values.where(is_decimal, values[~is_decimal].map(_decimal_from_exponent))
+
+# Readings repeat the same handful of values, so each scaled value literal is
+# formatted once per (lexical form, unit factor) in each worker.
+value_literal_cache = {}
+
+def scaled_value_literal(lexical, factor):
+    """Returns the xsd:decimal N-Triples literal for lexical * factor, computed exactly.
+
+    A value whose unit needs no scaling keeps the lexical form it has in the CSV.
+    """
+    literal = value_literal_cache.get((lexical, factor))
+    if literal is None:
+        scaled = lexical if factor == 1 else format((Decimal(lexical) * factor).normalize(), 'f')
+        literal = value_literal_cache[(lexical, factor)] = nt_literal(scaled, XSD_DECIMAL)
+    return literal
+
+def generate_reading_blocks(df):
+    """Yields (key, triple count, text) blocks stating each reading in df as an SDC
+    of its quality class, with its artifact, unit and a MICE holding the scaled value.
+
+    Each block holds the triples of one entity, or of one reading's unit or value,
+    keyed by a tuple or a 64-bit hash, so the parent can drop a block an earlier
+    chunk already wrote. Rows lacking an artifact, kind, unit or timestamp name no
+    reading and are left out. Artifacts, kinds, units and timestamps are resolved
+    once per distinct value and broadcast back to the rows by factorized code.
+    """
+    df = df[(df[['artifact_id', 'sdc_kind', 'unit_label', 'timestamp']] != "").all(axis=1)]
+    artifact_codes, artifact_labels = pd.factorize(df['artifact_id'].str.replace(" ", "-", regex=False))
+    artifact_slugs = [sys.intern(_slug(label)) for label in artifact_labels]
+    for label, artifact_slug in zip(artifact_labels, artifact_slugs):
+        artifact_nt = f"<{EX_BASE}{artifact_slug}>"
+        yield ("artifact", artifact_slug), 2, render_triples([
+            (artifact_nt, P_TYPE, T_CCO_ART),
+            (artifact_nt, P_LABEL, nt_label(label)),
+        ])
+    unit_codes, unit_labels = pd.factorize(df['unit_label'])
+    units = [resolve_unit(unit_raw) for unit_raw in unit_labels]
+    for unit_raw, (unit_uri, _, is_cco_unit) in zip(unit_labels, units):
+        unit_triples = [(f"<{unit_uri}>", P_TYPE, T_CCO_MU)]
+        if not is_cco_unit:
+            unit_triples.append((f"<{unit_uri}>", P_LABEL, nt_label(unit_raw)))
+        yield ("unit", unit_uri), len(unit_triples), render_triples(unit_triples)
+    kind_codes, kinds = pd.factorize(df['sdc_kind'])
+    kinds = [tuple(map(sys.intern, canonicalize_kind(kind))) for kind in kinds]
+    timestamp_codes, timestamps = pd.factorize(df['timestamp'])
+    timestamp_slugs = [_slug(timestamp) for timestamp in timestamps]
+    timestamp_literals = [nt_literal(timestamp, XSD_DATETIME) for timestamp in timestamps]
+
+    reading_slugs = [
+        f"{artifact_slugs[a]}_{kinds[k][1]}_{timestamp_slugs[t]}"
+        for a, k, t in zip(artifact_codes, kind_codes, timestamp_codes)
+    ]
+    reading_uris = [f"<{EX_BASE}{reading_slug}>" for reading_slug in reading_slugs]
+    mice_uris = [f"<{EX_BASE}MICE_{reading_slug}>" for reading_slug in reading_slugs]
+    reading_keys = pd.util.hash_array(np.array(reading_slugs, dtype=object))
+    for i in _first_of_each(reading_keys):
+        a, k, t = artifact_codes[i], kind_codes[i], timestamp_codes[i]
+        canon_kind_label, canon_kind_slug = kinds[k]
+        reading_nt, mice_nt = reading_uris[i], mice_uris[i]
+        label = f"{artifact_labels[a]}_{canon_kind_label} @ {timestamps[t]}"
+        triples = [(reading_nt, P_TYPE, T_SDC)]
+        qual_class_uri = quality_class(canon_kind_label, canon_kind_slug)
+        if qual_class_uri is not None:
+            triples.append((reading_nt, P_TYPE, f"<{qual_class_uri}>"))
+        triples += [
+            (reading_nt, P_LABEL, nt_label(label)),
+            (reading_nt, P_INHERES_IN, f"<{EX_BASE}{artifact_slugs[a]}>"),
+            (reading_nt, P_IS_MEASURED_BY, mice_nt),
+            (mice_nt, P_TYPE, T_CCO_MICE),
+            (mice_nt, P_LABEL, nt_label(f"MICE for {label}")),
+            (mice_nt, P_CCO_IS_MEASURE_OF, reading_nt),
+            (mice_nt, P_EX_HAS_TIMESTAMP, timestamp_literals[t]),
+        ]
+        yield int(reading_keys[i]), len(triples), render_triples(triples)
+
+    # A reading's unit and value vary by row, so each gets blocks of its own.
+    row_units = [f"<{units[u][0]}>" for u in unit_codes]
+    unit_keys = _pair_hashes(reading_slugs, row_units)
+    for i in _first_of_each(unit_keys):
+        yield int(unit_keys[i]), 2, render_triples([
+            (mice_uris[i], P_CCO_USES_MU, row_units[i]),
+            (reading_uris[i], P_CCO_USES_MU, row_units[i]),
+        ])
+    row_values = [scaled_value_literal(value, units[u][1]) for value, u in zip(df['value'], unit_codes)]
+    value_keys = _pair_hashes(reading_slugs, row_values)
+    for i in _first_of_each(value_keys):
+        yield int(value_keys[i]), 1, render_triples([(mice_uris[i], P_CCO_HAS_VALUE, row_values[i])])
+
+def _first_of_each(keys):
+    """Returns the row positions of the first occurrence of each distinct key, in row order."""
+    return np.sort(np.unique(keys, return_index=True)[1])
+
+def _pair_hashes(firsts, seconds):
+    """Returns a 64-bit hash of each (first, second) string pair, as a uint64 array."""
+    pairs = pd.DataFrame({'first': firsts, 'second': seconds}, dtype=object)
+    return pd.util.hash_pandas_object(pairs, index=False).to_numpy()
+
+def open_output(path):
+    """Opens path for writing text, gzip-compressed when the file name ends in .gz."""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'wt', encoding='utf-8')
+    return open(path, 'w', encoding='utf-8', buffering=1 << 20)
+
+def convert_chunk(chunk):
+    """Converts one CSV chunk to MICE Turtle or N-Triples text, or to term tuples for
+    Jelly output; runs in a worker process.
+
+    Each reading's MICE output is returned with its MICE id, so the parent can drop
+    a reading an earlier chunk already wrote. The chunk's keyed per-reading blocks
+    (see generate_reading_blocks()) and its distinct (artifact_id, sdc_kind) rows,
+    unit labels and values are returned alongside, so the parent can write each
+    entity exactly once, together with the number of rows skipped for a value
+    that is not a number.
+    """
+    # Stray whitespace is cleaned a whole column at a time, so ids, kinds and units
+    # reach safe_name() (and its cache) already stripped.
+    for column in READING_COLUMNS:
+        chunk[column] = chunk[column].str.strip()
+    chunk['value'] = decimal_lexical(chunk['value'])
+    is_number = chunk['value'].str.fullmatch(XSD_DECIMAL_PATTERN)
+    n_skipped = len(chunk) - int(is_number.sum())
+    chunk = chunk[is_number]
+    # A repeated reading hashes to the same MICE, so within a chunk it is written once.
+    chunk = chunk.drop_duplicates(subset=READING_COLUMNS)
+    if JELLY_OUT:
+        readings = list(generate_terms(chunk))
+    else:
+        readings = list(generate_turtle(chunk) if TURTLE_OUT else generate_triples(chunk))
+    blocks = list(generate_reading_blocks(chunk))
+    sdcs = chunk[['artifact_id', 'sdc_kind']].drop_duplicates()
+    return readings, blocks, sdcs, chunk['unit_label'].unique(), chunk['value'].unique(), n_skipped
+
+def read_chunks(path, columns=READING_COLUMNS):
+    """Yields the given columns of the CSV at path as DataFrames of about CHUNK_SIZE rows.
+
+    Uses pyarrow's multithreaded CSV reader when it is installed. All columns are
+    read as strings with empty cells kept as "", like pandas with dtype=str.
+    """
+    if pacsv is None:
+        yield from pd.read_csv(path, usecols=columns, dtype=str, keep_default_na=False, chunksize=CHUNK_SIZE)
+        return
+    convert_options = pacsv.ConvertOptions(
+        include_columns=columns,
+        column_types={column: pa.string() for column in columns},
+    )
+    # Arrow batches by bytes, not rows; a reading row is well under 64 bytes.
+    read_options = pacsv.ReadOptions(block_size=CHUNK_SIZE * 64)
+    with pacsv.open_csv(path, read_options=read_options, convert_options=convert_options) as reader:
+        for batch in reader:
+            yield batch.to_pandas()
+
+def read_kinds(path):
+    """Returns the distinct sdc_kind values of the CSV at path, read one chunk at a time."""
+    kinds = set()
+    for chunk in read_chunks(path, columns=['sdc_kind']):
+        kinds.update(chunk['sdc_kind'].unique())
+    return pd.Series(sorted(kinds), dtype=object)
+
+def convert_chunks(reader, pool):
+    """Yields (rows, triples, parts, skipped) for each CSV chunk, converted in the pool.
+
+    parts holds the chunk's output in order: text, or for Jelly output lists of
+    term tuples.
+
+    The pool gets one chunk per worker at a time, so memory stays bounded by
+    WORKERS * CHUNK_SIZE rows; map() keeps the output in CSV order. Static
+    entity triples are emitted here, in the parent, the first time each entity
+    is seen in any chunk, and so is each reading and each per-reading block;
+    rows and triples count only what is written.
+    """
+    seen_static_entities = set()
+    seen_readings = set()
+    seen_blocks = set()
+    while batch := list(itertools.islice(reader, WORKERS)):
+        for readings, blocks, sdcs, units, values, skipped in pool.map(convert_chunk, batch):
+            static = list(generate_static_triples(sdcs, units, values, seen_static_entities))
+            parts = [render_triples(static)]
+            for mice_id, reading in readings:
+                if mice_id not in seen_readings:
+                    seen_readings.add(mice_id)
+                    parts.append(reading)
+            rows = len(parts) - 1
+            triples = len(static) + 5 * rows
+            for key, n, block in blocks:
+                if key not in seen_blocks:
+                    seen_blocks.add(key)
+                    parts.append(block)
+                    triples += n
+            yield rows, triples, parts, skipped
+
+# Undoes the escapes of _NT_ESCAPES.
+_NT_UNESCAPES = {"\\\\": "\\", '\\"': '"', "\\n": "\n", "\\r": "\r"}
+_NT_ESCAPE_SEQUENCE = re.compile(r'\\[\\"nr]')
+
+def jelly_term(term):
+    """Returns the pyjelly term for an N-Triples IRI, or for a literal as nt_literal() or nt_label() format it."""
+    if term[0] == "<":
+        return JellyIRI(term[1:-1])
+    end = term.rindex('"')
+    lexical = _NT_ESCAPE_SEQUENCE.sub(lambda match: _NT_UNESCAPES[match.group(0)], term[1:end])
+    if term[end + 1] == "@":
+        return JellyLiteral(lexical, langtag=term[end + 2:])
+    return JellyLiteral(lexical, datatype=term[end + 4:-1])
+
+def jelly_graph_term(term):
+    """Returns the pyjelly term for a URIRef or Literal of the schema graph."""
+    if isinstance(term, Literal):
+        datatype = str(term.datatype) if term.datatype is not None else None
+        return JellyLiteral(str(term), langtag=term.language, datatype=datatype)
+    return JellyIRI(str(term))
+
+def write_jelly(graph, reader, pool):
+    """Writes the schema and instance triples as a flat Jelly stream of triples.
+
+    Each chunk's instance triples arrive as N-Triples term tuples and are turned
+    straight into pyjelly terms, so they are never parsed and never pass through
+    rdflib; the fixed predicates and classes are converted once.
+    Returns the number of readings written, of instance triples written and of
+    readings skipped.
+    """
+    fixed_terms = {term: jelly_term(term) for term in TURTLE_TERMS}
+    n_rows = 0
+    n_triples = 0
+    n_skipped = 0
+    def statements():
+        nonlocal n_rows, n_triples, n_skipped
+        for s, p, o in graph:
+            yield JellyTriple(jelly_graph_term(s), jelly_graph_term(p), jelly_graph_term(o))
+        for rows, triples, parts, skipped in convert_chunks(reader, pool):
+            n_rows += rows
+            n_triples += triples
+            n_skipped += skipped
+            for part in parts:
+                for s, p, o in part:
+                    yield JellyTriple(jelly_term(s), fixed_terms.get(p) or jelly_term(p), fixed_terms.get(o) or jelly_term(o))
+    with open(OUT_FILE, 'wb') as f:
+        flat_stream_to_file(statements(), f)
+    return n_rows, n_triples, n_skipped
+
+def report_skipped(n_skipped):
+    if n_skipped:
+        print(f"Warning: skipped {n_skipped} readings whose value is not a finite number.")
+
+def main():
+    if JELLY_OUT and flat_stream_to_file is None:
+        print("Error: writing .jelly output requires pyjelly (pip install pyjelly).")
+        sys.exit(1)
+    if not CSV_FILE.exists():
+        print(f"Error: CSV file not found at {CSV_FILE.resolve()}. Ensure the ETL step ran successfully.")
+        with open(OUT_FILE, 'w') as f:
+            f.write("@prefix ex: <http://example.org/measurement/> .\n")
+        return
+    graph = setup_graph()
+    # The schema graph is small, so its type objects are read off directly; the
+    # streamed readings are typed with STREAMED_CLASSES only.
+    typed_classes = set(graph.objects(None, NS_RDF.type)) | STREAMED_CLASSES
+    typed_classes |= add_quality_classes(graph, read_kinds(CSV_FILE))
+    add_missing_definitions(graph, typed_classes)
+    print(f"Loading data from {CSV_FILE} in chunks of {CHUNK_SIZE} rows across {WORKERS} workers")
+    print(f"Writing {len(graph)} graph triples and streaming instance triples to {OUT_FILE}")
+    # Instance triples are written straight to the file as Turtle or N-Triples text,
+    # so they never have to be held in the graph or pass through rdflib at all.
+    n_rows = 0
+    n_triples = 0
+    n_skipped = 0
+    reader = read_chunks(CSV_FILE)
+    if JELLY_OUT:
+        with multiprocessing.Pool(WORKERS) as pool:
+            n_rows, n_triples, n_skipped = write_jelly(graph, reader, pool)
+        print(f"Wrote {n_triples} instance triples for {n_rows} readings.")
+        report_skipped(n_skipped)
+        return
+    with open_output(OUT_FILE) as f, multiprocessing.Pool(WORKERS) as pool:
+        if '.nt' in OUT_FILE.suffixes:
+            f.write(graph.serialize(format='nt'))
+        else:
+            f.write(serialize_turtle(graph))
+            f.write(TURTLE_PREFIX_LINES)
+        for rows, triples, parts, skipped in convert_chunks(reader, pool):
+            f.writelines(parts)
+            n_rows += rows
+            n_triples += triples
+            n_skipped += skipped
+    print(f"Wrote {n_triples} instance triples for {n_rows} readings.")
+    report_skipped(n_skipped)
+
+    if OUT_FILE.exists():
+        print(f"✅ TTL file saved successfully.")
+    else:
+        print("❌ TTL file was not saved!")
+
+if __name__ == '__main__':
+    main()
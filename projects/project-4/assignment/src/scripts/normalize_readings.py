@@ -1,72 +1,202 @@
+import numpy as np
 import pandas as pd
+import csv
+import heapq
 import json
-from dateutil import parser as dateparser
+import operator
+import os
 from pathlib import Path
-import datetime
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 import sys
 import io
+import tempfile
+from typing import Optional, Union
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: falls back to pandas' CSV reader
+    pa = pacsv = None
+try:
+    import ijson
+except ImportError:  # optional: large sensor B files are then loaded whole
+    ijson = None
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json parser
+    orjson = None
+try:
+    import msgspec
+except ImportError:  # optional: sensor B is then decoded into plain dicts
+    msgspec = None
+try:
+    import simdjson
+except ImportError:  # optional: used for sensor B only when msgspec is missing
+    simdjson = None
 
 # --- INPUT/OUTPUT PATHS (Confirmed correct for your workflow) ---
 IN_A = Path("src/data/sensor_A.csv") 
 IN_B = Path("src/data/sensor_B.json")
 IN_C = Path("src/data/sensor_C.csv")
 OUT  = Path("src/data/readings_normalized.csv")
+# Print the per-column missing-value diagnostics (a full scan of the frame)
+VERBOSE = bool(os.environ.get("NORMALIZE_VERBOSE"))
 # ----------------------------------------------------------------------------------
 
+# Keys are lowercase: labels are lowercased before the lookup, and a label with no
+# entry (e.g. "C" or "Ω") is kept as it is.
+UNIT_MAP = {
+    "celsius": "C", "°c": "C",
+    "kilogram": "kg", "kg": "kg",
+    "meter": "m", "m": "m",
+    "fahrenheit": "F", "f": "F", "°f":"F", 
+    # FINAL FIX: Map all kPa and psi forms to the canonical unit 'Pa' (Pascal)
+    "kilopascal": "Pa", "kpa": "Pa",
+    "psi": "Pa",
+    "voltage": "V", "v": "V",
+    "ohm": "Ω", "omega": "Ω",
+    "volt": "V"
+}
+# Sensor CSV headers -> canonical column names
+SENSOR_A_COLUMNS = {
+    "Device Name": "artifact_id",
+    "Reading Type": "sdc_kind",
+    "Units": "unit_label",
+    "Reading Value": "value",
+    "Time (Local)": "timestamp",
+    # Fallback names
+    "asset_id": "artifact_id", "measure_type": "sdc_kind", "unit": "unit_label", 
+    "reading": "value", "time": "timestamp",
+}
+CANONICAL_COLS = ["artifact_id", "sdc_kind", "unit_label", "value", "timestamp"]
+SENSOR_NA_VALUES = ["", "NA", "NaN"]
+# Timestamp layouts the sensors are known to emit, tried in order before falling back to "mixed"
+TIMESTAMP_FORMATS = ["ISO8601", "%m/%d/%y %H:%M"]
+# Inputs at least this big in total are normalized in chunks of NORMALIZE_CHUNK_ROWS rows
+# and merged into OUT, so peak memory follows the chunk size rather than the input size.
+STREAM_INPUT_MIN_BYTES = 256 * 1024 * 1024
+NORMALIZE_CHUNK_ROWS = 200_000
+# Rows are sorted by artifact, then timestamp; streamed runs are merged on the same key
+SORT_KEY = operator.itemgetter(CANONICAL_COLS.index("artifact_id"), CANONICAL_COLS.index("timestamp"))
+# Sensor B files at least this big are streamed with ijson when it is installed
+STREAM_JSON_MIN_BYTES = 64 * 1024 * 1024
+
+if msgspec is not None:
+    # Schema for the nested sensor B layout. Only the fields that are kept are
+    # declared, so msgspec skips every other key without building Python objects.
+    class SensorBRecord(msgspec.Struct):
+        kind: Optional[str] = None
+        unit: Optional[str] = None
+        value: Union[float, str, None] = None
+        time: Optional[str] = None
+
+    class SensorBGroup(msgspec.Struct):
+        entity_id: Optional[str] = None
+        data: list[SensorBRecord] = []
+
+    class SensorBPayload(msgspec.Struct):
+        readings: list[SensorBGroup]
+
+    SENSOR_B_DECODER = msgspec.json.Decoder(SensorBPayload)
+
 def load_sensor_a(file_path):
     """
     Loads data from a CSV, renames columns to canonical names, and selects them.
     """
-    df_a = pd.read_csv(file_path, dtype=str, keep_default_na=False, na_values=["", "NA", "NaN"])
-    
+    return canonical_columns(read_sensor_csv(file_path))
+
+def canonical_columns(df_a):
+    """
+    Renames sensor CSV columns to canonical names and keeps only those.
+    """
     # Map columns to canonical names
-    df_a = df_a.rename(columns={
-        "Device Name": "artifact_id",
-        "Reading Type": "sdc_kind",
-        "Units": "unit_label",
-        "Reading Value": "value",
-        "Time (Local)": "timestamp",
-        # Fallback names
-        "asset_id": "artifact_id", "measure_type": "sdc_kind", "unit": "unit_label", 
-        "reading": "value", "time": "timestamp",
-    })
+    df_a = df_a.rename(columns=SENSOR_A_COLUMNS)
     
     # Keep only canonical columns
-    canonical_cols = ["artifact_id", "sdc_kind", "unit_label", "value", "timestamp"]
-    df_a = df_a[[c for c in canonical_cols if c in df_a.columns]]
+    df_a = df_a[[c for c in CANONICAL_COLS if c in df_a.columns]]
     return df_a
 
+def iter_sensor_a(file_path):
+    """
+    Yields a sensor CSV in frames of NORMALIZE_CHUNK_ROWS rows, shaped like load_sensor_a's.
+    """
+    with pd.read_csv(file_path, dtype=str, keep_default_na=False, na_values=SENSOR_NA_VALUES,
+                     usecols=lambda c: c in SENSOR_A_COLUMNS, chunksize=NORMALIZE_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            yield canonical_columns(chunk)
+
+def read_sensor_csv(file_path):
+    """
+    Reads only the known sensor columns of a CSV as strings, with SENSOR_NA_VALUES as missing.
+    Uses pyarrow's multithreaded reader when it is installed, and pandas' reader for
+    files pyarrow rejects, e.g. for a row with a missing field.
+    """
+    if pacsv is not None:
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), [])
+        columns = [c for c in header if c in SENSOR_A_COLUMNS]
+        convert_options = pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={c: pa.string() for c in columns},
+            null_values=SENSOR_NA_VALUES,
+            strings_can_be_null=True,
+        )
+        try:
+            return pacsv.read_csv(file_path, convert_options=convert_options).to_pandas()
+        except pa.ArrowInvalid:
+            pass  # pandas pads a short row with missing values instead of failing
+    return pd.read_csv(file_path, dtype=str, keep_default_na=False, na_values=SENSOR_NA_VALUES,
+                       usecols=lambda c: c in SENSOR_A_COLUMNS)
+
 def load_sensor_b(file_path):
     """
     Loads data from a JSON/NDJSON file and maps keys to canonical names.
     (Fixed for nested structure parsing)
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        raw_txt = f.read().strip()
+    if ijson is not None and Path(file_path).stat().st_size >= STREAM_JSON_MIN_BYTES:
+        # Large nested dumps are parsed one reading group at a time instead of whole
+        with open(file_path, 'rb') as f:
+            try:
+                records = list(nested_records(ijson.items(f, 'readings.item', use_float=True)))
+            except ijson.JSONError:
+                records = []
+        if records:
+            return pd.DataFrame(records)
+
+    if msgspec is not None:
+        # Files that do not match the nested schema fall through to the generic parser
+        try:
+            payload = SENSOR_B_DECODER.decode(Path(file_path).read_bytes())
+        except msgspec.DecodeError:
+            payload = None
+        if payload is not None:
+            return nested_frame(payload.readings)
+    elif simdjson is not None:
+        # Lazy proxies: only the fields read below become Python objects
+        try:
+            doc = simdjson.Parser().parse(Path(file_path).read_bytes())
+        except ValueError:
+            doc = None
+        readings = doc.get("readings") if isinstance(doc, simdjson.Object) else None
+        if isinstance(readings, simdjson.Array):
+            return lazy_nested_frame(readings)
+
+    # Kept as bytes: both parsers take UTF-8 bytes directly, so no str copy is decoded
+    raw_bytes = Path(file_path).read_bytes().strip()
     
     records = []
     try:
-        obj = json.loads(raw_txt)
+        obj = parse_json(raw_bytes)
         
         # Handle the nested structure from your uploaded JSON file
         if isinstance(obj, dict) and "readings" in obj and isinstance(obj["readings"], list):
-             for reading_group in obj["readings"]:
-                 entity_id = reading_group.get("entity_id")
-                 for data_record in reading_group.get("data", []):
-                     records.append({
-                         "artifact_id": entity_id, 
-                         "sdc_kind": data_record.get("kind"),
-                         "unit_label": data_record.get("unit"),
-                         "value": data_record.get("value"),
-                         "timestamp": data_record.get("time")
-                     })
-             return pd.DataFrame([r for r in records if r.get('artifact_id') is not None])
+             return pd.DataFrame(list(nested_records(obj["readings"])))
 
         # Fallback to original logic for standard/flat JSON structure
         records = obj.get("records", obj) if isinstance(obj, dict) else (obj if isinstance(obj, list) else [obj])
     except json.JSONDecodeError:
         # NDJSON fallback
-        records = [json.loads(line) for line in raw_txt.splitlines() if line.strip()]
+        records = [parse_json(line) for line in raw_bytes.splitlines() if line.strip()]
 
     if isinstance(records, dict): records = [records]
     elif not isinstance(records, list): records = [records]
@@ -81,66 +211,245 @@ def load_sensor_b(file_path):
 
     return df_b
 
-def to_iso8601(x):
+def parse_json(text):
     """
-    Converts a timestamp to ISO8601 format, assuming UTC if timezone is missing.
+    Parses a JSON document with orjson when it is installed, otherwise with json.
     """
-    try:
-        dt = dateparser.parse(str(x))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=datetime.timezone.utc)
-        return dt.astimezone(datetime.timezone.utc).isoformat().replace("+00:00","Z")
-    except Exception:
-        return None
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity literals, which only the stdlib parser accepts
+    return json.loads(text)
+
+def nested_records(reading_groups):
+    """
+    Yields canonical records from the nested {"readings": [{"entity_id": ..., "data": [...]}]} layout.
+    """
+    for reading_group in reading_groups:
+        entity_id = reading_group.get("entity_id")
+        if entity_id is None:
+            continue
+        for data_record in reading_group.get("data", []):
+            yield {
+                "artifact_id": entity_id, 
+                "sdc_kind": data_record.get("kind"),
+                "unit_label": data_record.get("unit"),
+                "value": data_record.get("value"),
+                "timestamp": data_record.get("time")
+            }
+
+def iter_sensor_b(file_path):
+    """
+    Yields sensor B in frames of NORMALIZE_CHUNK_ROWS rows, streamed with ijson when it is installed.
+    Layouts other than the nested one are loaded whole with load_sensor_b.
+    """
+    n_yielded = 0
+    if ijson is not None:
+        batch = []
+        with open(file_path, 'rb') as f:
+            try:
+                for record in nested_records(ijson.items(f, 'readings.item', use_float=True)):
+                    batch.append(record)
+                    if len(batch) == NORMALIZE_CHUNK_ROWS:
+                        yield pd.DataFrame(batch)
+                        n_yielded += len(batch)
+                        batch = []
+            except ijson.JSONError:
+                if n_yielded:
+                    raise
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch)
+            n_yielded += len(batch)
+    if not n_yielded:
+        yield load_sensor_b(file_path)
+
+def nested_frame(groups):
+    """
+    Builds the canonical frame from decoded SensorBGroup structs, one column list at a time.
+    """
+    groups = [group for group in groups if group.entity_id is not None]
+    return pd.DataFrame({
+        "artifact_id": [group.entity_id for group in groups for _ in group.data],
+        "sdc_kind": [rec.kind for group in groups for rec in group.data],
+        "unit_label": [rec.unit for group in groups for rec in group.data],
+        "value": [rec.value for group in groups for rec in group.data],
+        "timestamp": [rec.time for group in groups for rec in group.data],
+    })
+
+def lazy_nested_frame(groups):
+    """
+    Builds the canonical frame from a simdjson "readings" array, one column list at a time.
+    """
+    ids, kinds, units, values, times = [], [], [], [], []
+    for group in groups:
+        entity_id = group.get("entity_id")
+        if entity_id is None:
+            continue
+        for rec in group.get("data", []):
+            ids.append(entity_id)
+            kinds.append(rec.get("kind"))
+            units.append(rec.get("unit"))
+            values.append(rec.get("value"))
+            times.append(rec.get("time"))
+    return pd.DataFrame({"artifact_id": ids, "sdc_kind": kinds, "unit_label": units,
+                         "value": values, "timestamp": times})
+
+def to_iso8601(column):
+    """
+    Converts a column of timestamps to ISO8601 UTC strings, assuming UTC if timezone is missing.
+    Unparseable entries become missing.
+    """
+    ts = pd.Series(pd.NaT, index=column.index, dtype="datetime64[ns, UTC]")
+    pending = column.notna().to_numpy()
+    # Explicit formats parse in C; only rows none of them match reach the per-value "mixed" parser
+    for fmt in TIMESTAMP_FORMATS:
+        if not pending.any():
+            break
+        ts[pending] = pd.to_datetime(column[pending], utc=True, errors="coerce", format=fmt)
+        pending = pending & ts.isna().to_numpy()
+    if pending.any():
+        # Sensors repeat the same poll times, so each distinct leftover string is parsed once
+        codes, uniques = pd.factorize(column[pending])
+        ts[pending] = pd.to_datetime(uniques, utc=True, errors="coerce", format="mixed").take(codes)
+    text = ts.dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Sub-second parts are kept as six-digit microseconds when non-zero, as isoformat() writes them
+    fractional = (ts.dt.microsecond.fillna(0) != 0).to_numpy()
+    if fractional.any():
+        text[fractional] = ts[fractional].dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return text
+
+def as_text(column):
+    """
+    Returns column as strings, skipping the copy when it already has a string dtype.
+    """
+    if isinstance(column.dtype, pd.StringDtype):
+        return column
+    return column.astype(str)
 
 def normalize_and_clean(df):
     """
     Performs data type conversion, standardization, unit mapping, and cleaning.
     """
-    # String cleaning
-    for col in ["artifact_id", "sdc_kind", "unit_label"]:
-        df[col] = df[col].astype(str).str.strip()
+    # String cleaning; a column that is already a string dtype is trimmed by one Arrow kernel
+    for col in ["artifact_id", "sdc_kind"]:
+        df[col] = as_text(df[col]).str.strip()
 
-    # Numeric conversion
-    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    # Numeric conversion; always float, so a chunk of whole numbers is written like any other
+    df["value"] = pd.to_numeric(df["value"], errors="coerce").astype(float)
 
     # Timestamp standardization
-    df["timestamp"] = df["timestamp"].apply(to_iso8601)
+    df["timestamp"] = to_iso8601(df["timestamp"])
 
     # Unit mapping standardization
-    UNIT_MAP = {
-        "celsius": "C", "°c": "C", "C": "C",
-        "kilogram": "kg", "KG": "kg", "kg": "kg",
-        "meter": "m", "M": "m", "m": "m",
-        "fahrenheit": "F", "f": "F", "°f":"F", 
-        # FINAL FIX: Map all kPa and psi forms to the canonical unit 'Pa' (Pascal)
-        "kilopascal": "Pa", "KPA": "Pa", "kpa": "Pa", "kPa": "Pa",
-        "psi": "Pa", "PSI": "Pa", 
-        "voltage": "V", "v": "V", "V": "V",
-        "ohm": "Ω", "omega": "Ω", "Ω": "Ω",
-        "volt": "V"
-    }
-    df["unit_label"] = df["unit_label"].astype(str).str.lower().map(UNIT_MAP).fillna(df["unit_label"])
+    # Unit labels have only a handful of distinct values, so each one is stripped and
+    # mapped once and the result is taken back out to every row (-1 picks the NaN slot).
+    unit_label = as_text(df["unit_label"])
+    codes, uniques = pd.factorize(unit_label)
+    canonical = [label.strip() for label in uniques]
+    canonical = np.array([UNIT_MAP.get(label.lower(), label) for label in canonical] + [np.nan], dtype=object)
+    df["unit_label"] = pd.Series(canonical[codes], index=df.index, dtype=unit_label.dtype)
     
     
     # ==========================================================
-    # <<< DIAGNOSTIC STATEMENTS >>>
+    # <<< DIAGNOSTIC STATEMENTS >>> (set NORMALIZE_VERBOSE to print)
     # ==========================================================
     
-    print(f"\n[DIAGNOSTICS] Total rows before dropping: {len(df)}")
-    print("[DIAGNOSTICS] Null/Missing values per column:")
-    print(df.isnull().sum())
+    if VERBOSE:
+        print(f"\n[DIAGNOSTICS] Total rows before dropping: {len(df)}")
+        print("[DIAGNOSTICS] Null/Missing values per column:")
+        print(df.isnull().sum())
     
     # ==========================================================
     
-    # Drop rows with missing critical data
-    df = df.dropna(subset=["artifact_id", "sdc_kind", "unit_label", "value", "timestamp"])
-    
-    # Sort and reset index
-    df = df.sort_values(["artifact_id", "timestamp"]).reset_index(drop=True)
+    # Drop rows with missing critical data, then sort, in a single take
+    keep = np.flatnonzero(df[CANONICAL_COLS].notna().all(axis=1).to_numpy())
+    # Keys are replaced by sorted factorize codes, so only distinct values are compared as
+    # strings and the row sort itself runs on integers
+    order = np.lexsort((
+        pd.factorize(df["timestamp"].iloc[keep], sort=True)[0],
+        pd.factorize(df["artifact_id"].iloc[keep], sort=True)[0],
+    ))
+    df = df.iloc[keep[order]].reset_index(drop=True)
     
     return df
 
+def write_csv(df, path):
+    """
+    Writes df to path as CSV without the index, using pyarrow's multithreaded writer when it is installed.
+    Values are formatted by pandas first, so the file matches DataFrame.to_csv byte for byte.
+    """
+    if pacsv is None:
+        df.to_csv(path, index=False)
+        return
+    table = pa.Table.from_pandas(df.astype(str), preserve_index=False)
+    # Arrow always quotes the header, so it is written here and the rows are left unquoted
+    with open(path, 'wb') as out_fp:
+        out_fp.write((",".join(df.columns) + "\n").encode("utf-8"))
+        try:
+            pacsv.write_csv(table, out_fp, write_options=pacsv.WriteOptions(include_header=False, quoting_style="none"))
+            return
+        except pa.ArrowInvalid:
+            pass  # a value holds a comma, quote or newline and needs pandas' quoting
+    df.to_csv(path, index=False)
+
+def combine_frames(frames):
+    """
+    Stacks the canonical columns of the loaded frames into one DataFrame, column by column.
+    Columns a frame lacks are filled with missing values. A column that is a string dtype
+    in every frame stays one, so normalize_and_clean can strip it without a copy.
+    """
+    columns = {}
+    for col in CANONICAL_COLS:
+        parts = [frame[col] if col in frame.columns
+                 else pd.Series(np.full(len(frame), np.nan, dtype=object)) for frame in frames]
+        columns[col] = pd.concat(parts, ignore_index=True) if parts else pd.Series(dtype=object)
+    return pd.DataFrame(columns, copy=False)
+
+def stream_normalize(sources):
+    """
+    Normalizes each source chunk by chunk and writes the distinct rows to OUT.
+    Each cleaned chunk comes out of normalize_and_clean already sorted, so it is spilled
+    to a temporary run file as is, and the runs are merged in input order. OUT thus holds
+    the same rows in the same order as the in-memory path. Duplicates share a sort key,
+    so they meet in the merge and only the first is written. Peak memory follows the
+    chunk size rather than the input size.
+    """
+    OUT.parent.mkdir(parents=True, exist_ok=True)
+    n_cleaned = n_rows = 0
+    with tempfile.TemporaryDirectory(dir=OUT.parent) as spill_dir:
+        run_paths = []
+        for name, chunks in sources.items():
+            n_loaded = 0
+            for chunk in chunks:
+                n_loaded += len(chunk)
+                cleaned = normalize_and_clean(combine_frames([chunk]))
+                n_cleaned += len(cleaned)
+                run_paths.append(Path(spill_dir) / f"run_{len(run_paths)}.csv")
+                cleaned.to_csv(run_paths[-1], header=False, index=False)
+            print(f"[normalize_readings] Input {name} rows loaded: {n_loaded}")
+        with ExitStack() as stack:
+            # Rows are merged as the text that was written, so they are compared and written verbatim
+            runs = [csv.reader(stack.enter_context(open(path, newline='', encoding='utf-8')))
+                    for path in run_paths]
+            out_fp = stack.enter_context(open(OUT, 'w', newline='', encoding='utf-8'))
+            writer = csv.writer(out_fp, lineterminator="\n")
+            writer.writerow(CANONICAL_COLS)
+            # heapq.merge() takes equal keys from earlier runs first, which keeps input order
+            group_key, group_rows = None, set()
+            for row in heapq.merge(*runs, key=SORT_KEY):
+                key = SORT_KEY(row)
+                if key != group_key:
+                    group_key, group_rows = key, set()
+                row = tuple(row)
+                if row not in group_rows:
+                    group_rows.add(row)
+                    writer.writerow(row)
+                    n_rows += 1
+    print(f"[normalize_readings] Duplicate readings dropped: {n_cleaned - n_rows}")
+    print(f"\nWrote {OUT} with {n_rows} rows.")
+
 def main():
     print(f"[paths] A: {IN_A}")
     print(f"[paths] B: {IN_B}")
@@ -149,29 +458,39 @@ def main():
     if not IN_A.exists() or not IN_B.exists() or not IN_C.exists():
         print("ERROR: One or more input files were not found at the expected path.")
         print(f"Please check that files exist at: {IN_A.parent.resolve()}")
-        df_a, df_b, df_c = pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+        frames = {"A": pd.DataFrame(), "B": pd.DataFrame(), "C": pd.DataFrame()}
+    elif sum(path.stat().st_size for path in (IN_A, IN_B, IN_C)) >= STREAM_INPUT_MIN_BYTES:
+        stream_normalize({"A": iter_sensor_a(IN_A), "B": iter_sensor_b(IN_B), "C": iter_sensor_a(IN_C)})
+        return None
     else:
-        # Load data from the files
-        df_a = load_sensor_a(IN_A)
-        df_b = load_sensor_b(IN_B)
-        df_c = load_sensor_a(IN_C)
-    
-    print(f"[normalize_readings] Input A rows loaded: {len(df_a)}")
-    print(f"[normalize_readings] Input B rows loaded: {len(df_b)}")
-    print(f"[normalize_readings] Input C rows loaded: {len(df_c)}")
+        # Load data from the files; the parsers release the GIL, so the three overlap on threads
+        loaders = {"A": (load_sensor_a, IN_A), "B": (load_sensor_b, IN_B), "C": (load_sensor_a, IN_C)}
+        with ThreadPoolExecutor(len(loaders)) as executor:
+            futures = {name: executor.submit(load, path) for name, (load, path) in loaders.items()}
+            frames = {name: future.result() for name, future in futures.items()}
+
+    for name, frame in frames.items():
+        print(f"[normalize_readings] Input {name} rows loaded: {len(frame)}")
 
-    # Combine all DataFrames
-    combined = pd.concat([df_a, df_b, df_c], ignore_index=True)
+    # Combine all DataFrames column by column; more sensors only extend the mapping
+    combined = combine_frames(frames.values())
 
     # Normalize and clean the combined data
     cleaned = normalize_and_clean(combined)
+
+    # Overlapping sensor dumps repeat whole readings; drop them here so they are not
+    # turned into triples again downstream. Rows that only share artifact, kind and
+    # timestamp are kept, since their value or unit still differs.
+    n_before = len(cleaned)
+    cleaned = cleaned.drop_duplicates(CANONICAL_COLS, ignore_index=True)
+    print(f"[normalize_readings] Duplicate readings dropped: {n_before - len(cleaned)}")
    
     # Ensure the output directory exists
     OUT.parent.mkdir(parents=True, exist_ok=True) 
     
     # Write the final output
     print(f"\nWriting {OUT} with {len(cleaned)} rows.")
-    cleaned.to_csv(OUT, index=False)
+    write_csv(cleaned, OUT)
     
     return cleaned
 
@@ -0,0 +1,91 @@
+"""Exact-IRI checks for the measurement design pattern, shared by the QC scripts.
+
+qc_fix.py and run_sparql_qc.py are thin wrappers around run_checks(). The output
+is parsed with Oxigraph when oxrdflib is installed.
+"""
+import gzip
+from pathlib import Path
+
+from rdflib import RDF, Graph, URIRef
+try:
+    import oxrdflib  # registers the "Oxigraph" store and "ox-turtle" parser with rdflib
+except ImportError:  # optional: falls back to rdflib's Turtle parser
+    oxrdflib = None
+try:
+    import pyjelly  # registers the "jelly" parser with rdflib
+except ImportError:  # optional: only needed to check .jelly output
+    pyjelly = None
+
+# Exact IRIs to enforce (must match the IRIs used in measure_rdflib.py)
+IRI_SDC   = URIRef("http://purl.obolibrary.org/obo/BFO_0000020")
+IRI_ART   = URIRef("https://www.commoncoreontologies.org/ont00000995")
+IRI_MU    = URIRef("https://www.commoncoreontologies.org/ont00000120")
+IRI_MICE  = URIRef("https://www.commoncoreontologies.org/ont00001163")
+
+IRI_BEARER_OF     = URIRef("http://purl.obolibrary.org/obo/BFO_0000196")
+IRI_IS_MEASURE_OF = URIRef("https://www.commoncoreontologies.org/ont00001966")
+IRI_USES_MU       = URIRef("https://www.commoncoreontologies.org/ont00001863")
+
+def parse_ttl(ttl_path) -> Graph:
+    """Parses the measure_rdflib.py output at ttl_path, into Oxigraph's store when oxrdflib is installed.
+
+    A .jelly file is read with pyjelly's parser. Anything else is read as Turtle
+    (N-Triples is a subset of it), gunzipped first when the name ends in .gz, with
+    Oxigraph's Rust parser when oxrdflib is installed.
+    """
+    ttl_path = Path(ttl_path)
+    graph = Graph(store="Oxigraph") if oxrdflib is not None else Graph()
+    if ttl_path.suffix == ".jelly":
+        if pyjelly is None:
+            raise ImportError("reading .jelly output requires pyjelly (pip install pyjelly)")
+        graph.parse(ttl_path, format="jelly")
+        return graph
+    with (gzip.open if ttl_path.suffix == ".gz" else open)(ttl_path, "rb") as f:
+        graph.parse(f, format="ox-turtle" if oxrdflib is not None else "turtle")
+    return graph
+
+def load_ttl(ttl_path) -> Graph:
+    """Parses ttl_path with parse_ttl() and reports its size."""
+    graph = parse_ttl(ttl_path)
+    print(f"[ttl] triples: {len(graph)}")
+    return graph
+
+def check_graph(g):
+    """Asserts the measurement design pattern holds in g, printing each check that passes."""
+    # The checks only need type lookups and two link checks per MICE, so they use the
+    # store's triple index directly instead of going through the SPARQL engine.
+    arts  = set(g.subjects(RDF.type, IRI_ART))
+    sdcs  = set(g.subjects(RDF.type, IRI_SDC))
+    mices = set(g.subjects(RDF.type, IRI_MICE))
+    mus   = set(g.subjects(RDF.type, IRI_MU))
+    A, S, M, U = len(arts), len(sdcs), len(mices), len(mus)
+
+    def measured_sdcs(m):
+        return [sdc for sdc in g.objects(m, IRI_IS_MEASURE_OF) if sdc in sdcs]
+
+    def has_unit(m):
+        return any(u in mus for u in g.objects(m, IRI_USES_MU))
+
+    # 1) Ensure at least one of each type appears using the EXACT class IRIs
+    assert all(v>0 for v in (A,S,M,U)), f"❌ Missing required typed nodes: Artifact={A}, SDC={S}, MICE={M}, MU={U}"
+    print(f"✅ Types present with exact IRIs: Artifact={A}, SDC={S}, MICE={M}, MU={U}")
+
+    # 2) Ensure at least one complete pattern exists using ONLY the exact property IRIs
+    pattern = any(
+        has_unit(m) and any(a in arts for sdc in measured_sdcs(m) for a in g.subjects(IRI_BEARER_OF, sdc))
+        for m in mices
+    )
+    assert pattern, "❌ No complete pattern found using the exact property IRIs."
+    print("✅ Complete pattern found with exact property IRIs.")
+
+    # 3) Verify every MICE uses the exact property IRIs (no alternative predicates)
+    n_bad = sum(1 for m in mices if not measured_sdcs(m) or not has_unit(m))
+    assert n_bad == 0, f"❌ Some MICE are missing required links with the exact IRIs (count={n_bad})."
+    print("✅ All MICE use exact IRIs for 'is measure of' and 'uses measurement unit'.")
+
+    print("✅ RDF passes exact-IRI checks for the measurement design pattern.")
+
+def run_checks(ttl_path) -> int:
+    """Loads ttl_path and runs check_graph() on it; returns 0, as failed checks raise AssertionError."""
+    check_graph(load_ttl(ttl_path))
+    return 0
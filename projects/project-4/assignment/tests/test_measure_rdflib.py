@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from rdflib import Graph, Literal, URIRef, XSD
+from rdflib.compare import isomorphic
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src" / "scripts"))
+
+import measure_rdflib  # noqa: E402
+from measure_rdflib import nt_literal, nt_literals, safe_name  # noqa: E402
+
+RESERVED = ['plain', 'back\\slash', 'a "quote"', 'line\nbreak', 'carriage\rreturn']
+
+def _parse_objects(literals):
+    g = Graph()
+    for i, literal in enumerate(literals):
+        g.parse(data=f"<http://example.org/s{i}> <http://example.org/p> {literal} .\n", format="nt")
+    return [g.value(URIRef(f"http://example.org/s{i}"), URIRef("http://example.org/p")) for i in range(len(literals))]
+
+def test_nt_literal_round_trips_reserved_characters():
+    literals = [nt_literal(text, XSD.string) for text in RESERVED]
+    assert all("\n" not in lit and "\r" not in lit for lit in literals)
+    assert _parse_objects(literals) == [Literal(text, datatype=XSD.string) for text in RESERVED]
+
+def test_nt_literals_matches_nt_literal():
+    column = pd.Series(RESERVED + RESERVED[:2], dtype=object)
+    assert list(nt_literals(column, XSD.string)) == [nt_literal(text, XSD.string) for text in column]
+
+def test_safe_name_gives_a_valid_iri():
+    raw = 'Boiler 07-<A>"{b}|c^`d\\e\tf'
+    iri = f"http://example.org/measurement/Artifact_{safe_name(raw)}"
+    g = Graph()
+    g.parse(data=f"<{iri}> <http://example.org/p> <http://example.org/o> .\n", format="nt")
+    assert set(g.subjects()) == {URIRef(iri)}
+    assert safe_name("Boiler 07-A") == "Boiler_07A"
+
+@pytest.mark.parametrize("raw", ["%", "50%RH", "a<b", "a%3Cb", 'x "y"\t|z'])
+def test_safe_name_passes_a_strict_iri_parser(raw):
+    pyoxigraph = pytest.importorskip("pyoxigraph")
+    pyoxigraph.NamedNode(f"http://example.org/measurement/MU_{safe_name(raw)}")
+
+def test_safe_name_keeps_escaped_and_raw_forms_apart():
+    assert safe_name("a<b") != safe_name("a%3Cb")
+
+def test_write_jelly_matches_n_triples_output(tmp_path, monkeypatch):
+    pytest.importorskip("pyjelly")
+    csv = ROOT / "src" / "data" / "readings_normalized.csv"
+    schema = measure_rdflib.setup_graph()
+    pool = SimpleNamespace(map=map)
+    monkeypatch.setattr(measure_rdflib, "TURTLE_OUT", False)
+    expected = Graph().parse(data=schema.serialize(format="nt"), format="nt")
+    for _, _, parts, _ in measure_rdflib.convert_chunks(measure_rdflib.read_chunks(csv), pool):
+        expected.parse(data="".join(parts), format="nt")
+    out = tmp_path / "measure_cco.jelly"
+    monkeypatch.setattr(measure_rdflib, "OUT_FILE", out)
+    monkeypatch.setattr(measure_rdflib, "JELLY_OUT", True)
+    n_rows, n_triples, _ = measure_rdflib.write_jelly(schema, measure_rdflib.read_chunks(csv), pool)
+    written = Graph().parse(out, format="jelly")
+    assert n_triples == len(expected) - len(schema) and n_rows > 0
+    assert isomorphic(written, expected)